@@ -3,7 +3,8 @@ Configuration management using Pydantic settings.
 Configured for Replit environment with PostgreSQL and OpenAI.
 """
 
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 import os
 
@@ -43,9 +44,7 @@ class Settings(BaseSettings):
     # Cache TTL (in seconds)
     CACHE_TTL: int = 300
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
     @property
     def cors_origins_list(self) -> List[str]:
@@ -55,5 +54,11 @@ class Settings(BaseSettings):
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing env/.env only once"""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -2,14 +2,24 @@
 Database setup using SQLAlchemy with PostgreSQL
 """
 import os
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, Float
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, Column, Index, Integer, String, Text, DateTime, Float, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
-
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_recycle=300)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))
+
+# Sized for the threadpool that runs the sync route handlers
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=300
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -17,6 +27,9 @@ Base = declarative_base()
 class Notice(Base):
     """Model for KIIT notices/information"""
     __tablename__ = "notices"
+    __table_args__ = (
+        Index("ix_notices_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500), nullable=False)
@@ -84,6 +97,60 @@ def get_db():
         db.close()
 
 
+# Trigram indexes backing the ILIKE '%keyword%' matches in SearchService
+SEARCH_INDEXED_COLUMNS = {
+    "notices": ["title", "content", "source_type"],
+    "courses": ["name", "code", "description", "department"],
+}
+
+
+def ensure_search_indexes():
+    """Create pg_trgm GIN indexes so keyword search avoids sequential scans"""
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for table, columns in SEARCH_INDEXED_COLUMNS.items():
+                for column in columns:
+                    conn.execute(text(
+                        f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm "
+                        f"ON {table} USING gin ({column} gin_trgm_ops)"
+                    ))
+    except Exception as e:
+        print(f"Could not create search indexes: {e}")
+
+
+def warm_pool(size: int = DB_POOL_SIZE):
+    """Open pool connections concurrently so first requests skip connect latency"""
+    if size <= 0:
+        return
+
+    def connect():
+        conn = engine.connect()
+        try:
+            conn.execute(text("SELECT 1"))
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    # Hold every connection until all are open so each one is a distinct pool slot
+    connections = []
+    with ThreadPoolExecutor(max_workers=size) as executor:
+        futures = [executor.submit(connect) for _ in range(size)]
+        for future in futures:
+            try:
+                connections.append(future.result())
+            except Exception as e:
+                print(f"Could not warm database connection: {e}")
+    for conn in connections:
+        conn.close()
+
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+    # create_all skips existing tables, so add indexes declared since then
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    ensure_search_indexes()
@@ -1,30 +1,31 @@
 """
 Load KIIT data from JSONL files into PostgreSQL database
 """
-import json
 import os
+import orjson
 from app.database import SessionLocal, Notice, Course, init_db
 from datetime import datetime
 
+ATTACHED_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "attached_assets"
+)
+
 
 def load_jsonl_file(filepath):
     """Load and parse a JSONL file"""
-    data = []
     if not os.path.exists(filepath):
         print(f"File not found: {filepath}")
-        return data
+        return []
     
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            if line.strip():
-                data.append(json.loads(line))
-    return data
+    with open(filepath, 'rb') as f:
+        lines = f.read().splitlines()
+    return [orjson.loads(line) for line in lines if line.strip()]
 
 
 def load_placement_data(db):
-    """Load placement data from JSONL"""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    filepath = os.path.join(base_dir, "attached_assets", "kiit_placement_1763445194133.jsonl")
+    """Load placement data from JSONL as Notice row mappings"""
+    filepath = os.path.join(ATTACHED_DIR, "kiit_placement_1763445194133.jsonl")
     data = load_jsonl_file(filepath)
     
     notices = []
@@ -32,7 +33,7 @@ def load_placement_data(db):
         section_id = record.get('section_id', '')
         
         if section_id == 'page':
-            notices.append(Notice(
+            notices.append(dict(
                 title=record.get('title', 'KIIT Placement Overview'),
                 content=record.get('summary', ''),
                 url=record.get('url', ''),
@@ -42,7 +43,7 @@ def load_placement_data(db):
         elif section_id == 'highlights_2024':
             data_obj = record.get('data', {})
             text = f"2024 Placement Highlights:\n- Companies Visited: {data_obj.get('companies_visited', 'N/A')}\n- Job Offers: {data_obj.get('job_offers', 'N/A')}\n- Highest Package: ₹{data_obj.get('highest_package_lakhs', 'N/A')} lakhs"
-            notices.append(Notice(
+            notices.append(dict(
                 title='KIIT Placement 2024 Highlights',
                 content=text,
                 url='https://kiit.ac.in/training-placement/',
@@ -58,7 +59,7 @@ def load_placement_data(db):
                 stats_text += f"  - Job Offers: {year_obj.get('job_offers', 'N/A')}\n"
                 stats_text += f"  - Highest Package: ₹{year_obj.get('highest_package_lakhs', 'N/A')} lakhs\n\n"
             
-            notices.append(Notice(
+            notices.append(dict(
                 title='KIIT Year-wise Placement Statistics (2014-2024)',
                 content=stats_text.strip(),
                 url='https://kiit.ac.in/training-placement/',
@@ -66,7 +67,7 @@ def load_placement_data(db):
             ))
         
         elif section_id == 'kiit_kareer_school':
-            notices.append(Notice(
+            notices.append(dict(
                 title=record.get('title', 'KIIT-Kareer School'),
                 content=record.get('text', ''),
                 url=record.get('read_more_url', 'https://kiit.ac.in'),
@@ -77,9 +78,8 @@ def load_placement_data(db):
 
 
 def load_courses_data(db):
-    """Load courses data from JSONL"""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    filepath = os.path.join(base_dir, "attached_assets", "kiit_courses_1763445194134.jsonl")
+    """Load courses data from JSONL as Course row mappings"""
+    filepath = os.path.join(ATTACHED_DIR, "kiit_courses_1763445194134.jsonl")
     data = load_jsonl_file(filepath)
     
     courses = []
@@ -89,7 +89,7 @@ def load_courses_data(db):
         if section_id == 'undergraduate_programs':
             programs = record.get('programs', [])
             for prog in programs:
-                courses.append(Course(
+                courses.append(dict(
                     name=prog.get('name', ''),
                     code=prog.get('name', '').replace(' ', '_').upper(),
                     description=f"{prog.get('name', '')} - {prog.get('duration', '')}. {prog.get('notes', '')}",
@@ -110,7 +110,7 @@ def load_courses_data(db):
                     
                     if specializations:
                         for spec in specializations:
-                            courses.append(Course(
+                            courses.append(dict(
                                 name=f"{degree} in {spec}",
                                 code=f"{degree}_{spec}".replace(' ', '_').upper(),
                                 description=f"{degree} program in {spec} offered by {school_name}",
@@ -123,9 +123,8 @@ def load_courses_data(db):
 
 
 def load_ranking_data(db):
-    """Load ranking and recognition data from JSONL"""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    filepath = os.path.join(base_dir, "attached_assets", "kiit_ranking_recognition_1763445194136.jsonl")
+    """Load ranking and recognition data from JSONL as Notice row mappings"""
+    filepath = os.path.join(ATTACHED_DIR, "kiit_ranking_recognition_1763445194136.jsonl")
     data = load_jsonl_file(filepath)
     
     notices = []
@@ -151,7 +150,7 @@ def load_ranking_data(db):
         
         if 'sdg_highlights' in record:
             sdg = record['sdg_highlights']
-            content_parts.append(f"SDG Highlights: {json.dumps(sdg, indent=2)}")
+            content_parts.append(f"SDG Highlights: {orjson.dumps(sdg, option=orjson.OPT_INDENT_2).decode()}")
         
         if 'schools' in record:
             schools_text = "\n".join([f"- {s.get('school', '')}: {s.get('rank', '')}" for s in record.get('schools', [])])
@@ -163,7 +162,7 @@ def load_ranking_data(db):
         
         content = "\n\n".join(content_parts) if content_parts else title
         
-        notices.append(Notice(
+        notices.append(dict(
             title=title,
             content=content,
             url=record.get('url', 'https://kiit.ac.in/about/ranking-recognition/'),
@@ -174,9 +173,8 @@ def load_ranking_data(db):
 
 
 def load_about_data(db):
-    """Load about/general KIIT data from JSONL"""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    filepath = os.path.join(base_dir, "attached_assets", "kiit_about_1763445194137.jsonl")
+    """Load about/general KIIT data from JSONL as Notice row mappings"""
+    filepath = os.path.join(ATTACHED_DIR, "kiit_about_1763445194137.jsonl")
     data = load_jsonl_file(filepath)
     
     notices = []
@@ -221,7 +219,7 @@ def load_about_data(db):
         elif 'quick_facts' in section_id or 'overview' in section_id:
             source_type = 'overview'
         
-        notices.append(Notice(
+        notices.append(dict(
             title=title,
             content=content,
             url=record.get('url', 'https://kiit.ac.in/about/'),
@@ -248,22 +246,22 @@ def main():
         # Load all data
         print("\nLoading placement data...")
         placement_notices = load_placement_data(db)
-        db.add_all(placement_notices)
+        db.bulk_insert_mappings(Notice, placement_notices)
         print(f"✅ Loaded {len(placement_notices)} placement notices")
         
         print("\nLoading courses data...")
         courses = load_courses_data(db)
-        db.add_all(courses)
+        db.bulk_insert_mappings(Course, courses)
         print(f"✅ Loaded {len(courses)} courses")
         
         print("\nLoading ranking data...")
         ranking_notices = load_ranking_data(db)
-        db.add_all(ranking_notices)
+        db.bulk_insert_mappings(Notice, ranking_notices)
         print(f"✅ Loaded {len(ranking_notices)} ranking notices")
         
         print("\nLoading about data...")
         about_notices = load_about_data(db)
-        db.add_all(about_notices)
+        db.bulk_insert_mappings(Notice, about_notices)
         print(f"✅ Loaded {len(about_notices)} about notices")
         
         db.commit()
@@ -3,25 +3,33 @@ Simplified FastAPI main application for Replit
 Uses PostgreSQL, OpenAI, and in-memory caching
 """
 
-from fastapi import FastAPI, Request, HTTPException, status
+from fastapi import FastAPI, HTTPException, Depends, Query, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from contextlib import asynccontextmanager
 import logging
 
 from app.config import settings
-from app.database import init_db, SessionLocal, Notice, Course, ChatHistory, Embedding
-from app.services.llm_service import llm_service
+from app.database import init_db, warm_pool, get_db, SessionLocal, Notice, Course, ChatHistory, Embedding
+from app.services.llm_service import llm_service, LLM_ERROR_RESPONSE
 from app.services.cache import cache
 from app.services.search import search_service
-from pydantic import BaseModel
+from app.services.chat_history import chat_history_buffer
+from pydantic import BaseModel, Field
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
 from typing import Optional
+from datetime import datetime
 import json
 
 # Setup logging
 logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# Admin counts move as the loader runs, so keep them much fresher than CACHE_TTL
+STATS_CACHE_TTL = 30
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -33,6 +41,7 @@ async def lifespan(app: FastAPI):
         # Initialize database
         logger.info("Initializing PostgreSQL database...")
         init_db()
+        warm_pool()
         
         # Seed data if needed
         db = SessionLocal()
@@ -44,6 +53,8 @@ async def lifespan(app: FastAPI):
             from app.seed_data import seed_basic_data
             seed_basic_data()
         
+        chat_history_buffer.start()
+        
         logger.info("KIIT ChatBot API started successfully!")
         
     except Exception as e:
@@ -54,6 +65,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down KIIT ChatBot API...")
+    chat_history_buffer.stop()
 
 
 # Create FastAPI app
@@ -63,6 +75,7 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -76,36 +89,49 @@ app.add_middleware(
 )
 
 
-# Rate limiting middleware
-@app.middleware("http")
-async def rate_limit_middleware(request: Request, call_next):
+# Rate limiting middleware (pure ASGI, avoids BaseHTTPMiddleware overhead)
+class RateLimitMiddleware:
     """Simple rate limiting"""
-    if request.url.path in ["/api/health", "/docs", "/redoc", "/openapi.json"]:
-        return await call_next(request)
-    
-    client_ip = request.client.host if request.client else "unknown"
-    
-    is_allowed, count = cache.check_rate_limit(
-        client_ip,
-        limit=settings.RATE_LIMIT_PER_MINUTE,
-        window=60
-    )
-    
-    if not is_allowed:
-        return JSONResponse(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={
-                "detail": "Rate limit exceeded. Please try again later.",
-                "retry_after": 60
-            }
+    EXEMPT_PATHS = {"/api/health", "/docs", "/redoc", "/openapi.json"}
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        
+        is_allowed, count = cache.check_rate_limit(
+            client_ip,
+            limit=settings.RATE_LIMIT_PER_MINUTE,
+            window=60
         )
-    
-    return await call_next(request)
+        
+        if not is_allowed:
+            response = ORJSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "detail": "Rate limit exceeded. Please try again later.",
+                    "retry_after": 60
+                }
+            )
+            await response(scope, receive, send)
+            return
+        
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(RateLimitMiddleware)
 
 
 # Pydantic models
 class ChatRequest(BaseModel):
-    query: str
+    # The normalised query is used as the response cache key, so bound its size
+    query: str = Field(..., max_length=2000)
     session_id: Optional[str] = None
 
 
@@ -114,6 +140,39 @@ class SearchRequest(BaseModel):
     limit: Optional[int] = 10
 
 
+async def answer_query(query: str):
+    """Run RAG search + LLM generation, returning (response_text, sources)"""
+    # Search for relevant information
+    results = await run_in_threadpool(search_service.search_all, query, 10)
+    
+    # Build context from search results
+    context_parts = []
+    sources = []
+    
+    for result in results:
+        if result["type"] == "notice":
+            context_parts.append(f"Title: {result['title']}\n{result['content']}")
+            sources.append({
+                "title": result["title"],
+                "url": result.get("url", ""),
+                "type": "notice"
+            })
+        elif result["type"] == "course":
+            context_parts.append(f"Course: {result['name']} ({result['code']})\n{result['description']}")
+            sources.append({
+                "title": result["name"],
+                "code": result["code"],
+                "type": "course"
+            })
+    
+    context = "\n\n".join(context_parts)
+    
+    # Generate response using LLM
+    response_text = await llm_service.generate_response(query, context)
+    
+    return response_text, sources
+
+
 # Routes
 @app.get("/")
 async def root():
@@ -141,53 +200,21 @@ async def health():
 async def chat(request: ChatRequest):
     """Chat endpoint with RAG"""
     try:
-        # Search for relevant information
-        results = search_service.search_all(request.query, limit=10)
-        
-        # Build context from search results
-        context_parts = []
-        sources = []
-        
-        for result in results:
-            if result["type"] == "notice":
-                context_parts.append(f"Title: {result['title']}\n{result['content']}")
-                sources.append({
-                    "title": result["title"],
-                    "url": result.get("url", ""),
-                    "type": "notice"
-                })
-            elif result["type"] == "course":
-                context_parts.append(f"Course: {result['name']} ({result['code']})\n{result['description']}")
-                sources.append({
-                    "title": result["name"],
-                    "code": result["code"],
-                    "type": "course"
-                })
+        # Repeated questions are answered from the response cache
+        cache_key = f"chat:{request.query.strip().lower()}"
+        cached = cache.get(cache_key)
         
-        context = "\n\n".join(context_parts)
+        if cached is not None:
+            response_text, sources = cached
+        else:
+            response_text, sources = await answer_query(request.query)
+            if response_text != LLM_ERROR_RESPONSE:
+                cache.set(cache_key, (response_text, sources))
         
-        # Generate response using LLM
-        response_text = llm_service.generate_response(request.query, context)
-        
-        # Save to chat history
+        # Save to chat history (batched and written in the background)
         if request.session_id:
-            db = SessionLocal()
-            try:
-                db.add(ChatHistory(
-                    session_id=request.session_id,
-                    role="user",
-                    content=request.query
-                ))
-                db.add(ChatHistory(
-                    session_id=request.session_id,
-                    role="assistant",
-                    content=response_text
-                ))
-                db.commit()
-            except Exception as e:
-                logger.error(f"Error saving chat history: {e}")
-            finally:
-                db.close()
+            chat_history_buffer.add(request.session_id, "user", request.query)
+            chat_history_buffer.add(request.session_id, "assistant", response_text)
         
         return {
             "response": response_text,
@@ -201,7 +228,7 @@ async def chat(request: ChatRequest):
 
 
 @app.get("/api/search")
-async def search(query: str, limit: int = 10):
+def search(query: str, limit: int = 10):
     """Search endpoint"""
     try:
         results = search_service.search_all(query, limit)
@@ -216,55 +243,90 @@ async def search(query: str, limit: int = 10):
 
 
 @app.get("/api/courses")
-async def get_courses(limit: int = 20):
-    """Get all courses"""
-    db = SessionLocal()
-    try:
-        courses = db.query(Course).limit(limit).all()
-        return [{
-            "id": c.id,
-            "name": c.name,
-            "code": c.code,
-            "description": c.description,
-            "department": c.department,
-            "duration": c.duration,
-            "eligibility": c.eligibility
-        } for c in courses]
-    finally:
-        db.close()
+def get_courses(limit: int = Query(20, ge=1, le=100), db: Session = Depends(get_db)):
+    """Get all courses (cached, courses rarely change)"""
+    cache_key = f"courses:{limit}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    courses = db.query(
+        Course.id, Course.name, Course.code, Course.description,
+        Course.department, Course.duration, Course.eligibility
+    ).limit(limit).all()
+    result = [{
+        "id": c.id,
+        "name": c.name,
+        "code": c.code,
+        "description": c.description,
+        "department": c.department,
+        "duration": c.duration,
+        "eligibility": c.eligibility
+    } for c in courses]
+    cache.set(cache_key, result)
+    return result
 
 
 @app.get("/api/notices/latest")
-async def get_latest_notices(limit: int = 10):
-    """Get latest notices"""
-    db = SessionLocal()
-    try:
-        notices = db.query(Notice).order_by(Notice.created_at.desc()).limit(limit).all()
-        return [{
-            "id": n.id,
-            "title": n.title,
-            "content": n.content,
-            "url": n.url,
-            "source_type": n.source_type,
-            "date": n.date.isoformat() if n.date else None
-        } for n in notices]
-    finally:
-        db.close()
+def get_latest_notices(
+    limit: int = Query(10, ge=1, le=100),
+    before: Optional[datetime] = None,
+    before_id: Optional[int] = None,
+    db: Session = Depends(get_db)
+):
+    """Get latest notices, paging backwards by (created_at, id)"""
+    if (before is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before and before_id must be given together")
+
+    # Only the first page is cached; cursors are client-supplied and unbounded,
+    # and limit is capped so the keys stay a small fixed set
+    cache_key = f"notices:latest:{limit}"
+    if before is None:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    query = db.query(
+        Notice.id, Notice.title, Notice.content, Notice.url,
+        Notice.source_type, Notice.date, Notice.created_at
+    )
+    if before is not None:
+        query = query.filter(tuple_(Notice.created_at, Notice.id) < (before, before_id))
+    notices = query.order_by(Notice.created_at.desc(), Notice.id.desc()).limit(limit).all()
+    result = [{
+        "id": n.id,
+        "title": n.title,
+        "content": n.content,
+        "url": n.url,
+        "source_type": n.source_type,
+        "date": n.date,
+        "created_at": n.created_at
+    } for n in notices]
+    if before is None:
+        cache.set(cache_key, result)
+    return result
 
 
 @app.get("/api/admin/stats")
-async def get_stats():
-    """Get database statistics"""
-    db = SessionLocal()
-    try:
-        return {
-            "notices": db.query(Notice).count(),
-            "courses": db.query(Course).count(),
-            "chat_history": db.query(ChatHistory).count(),
-            "embeddings": db.query(Embedding).count()
-        }
-    finally:
-        db.close()
+def get_stats(db: Session = Depends(get_db)):
+    """Get database statistics (cached briefly, stats are read-heavy)"""
+    stats = cache.get("admin:stats")
+    if stats is not None:
+        return stats
+
+    # One round-trip: each count is a scalar subquery of a single SELECT
+    counts = db.execute(select(*[
+        select(func.count()).select_from(model).scalar_subquery()
+        for model in (Notice, Course, ChatHistory, Embedding)
+    ])).one()
+    stats = {
+        "notices": counts[0],
+        "courses": counts[1],
+        "chat_history": counts[2],
+        "embeddings": counts[3]
+    }
+    cache.set("admin:stats", stats, ttl=STATS_CACHE_TTL)
+    return stats
 
 
 if __name__ == "__main__":
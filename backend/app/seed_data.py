@@ -16,28 +16,28 @@ def seed_basic_data():
         
         # KIIT Basic Information
         notices = [
-            Notice(
+            dict(
                 title="About KIIT University",
                 content="KIIT (Kalinga Institute of Industrial Technology) is a deemed-to-be-university located in Bhubaneswar, Odisha, India. Established in 1992 by Dr. Achyuta Samanta, KIIT has grown into one of India's premier institutions. The university offers undergraduate, postgraduate, and doctoral programs across various disciplines including engineering, medicine, law, management, and humanities.",
                 source_type="basic_info",
                 url="https://kiit.ac.in/about"
             ),
-            Notice(
+            dict(
                 title="KIIT Campus Location",
                 content="KIIT University main campus is located at Patia, Bhubaneswar, Odisha 751024, India. The campus spans over 25 square kilometers and houses state-of-the-art facilities including modern classrooms, laboratories, libraries, sports complexes, and hostels.",
                 source_type="basic_info"
             ),
-            Notice(
+            dict(
                 title="KIIT Accreditation",
                 content="KIIT University has been accredited with A++ grade by NAAC (National Assessment and Accreditation Council). It is also recognized by UGC and has received various rankings from NIRF (National Institutional Ranking Framework). The university is known for its quality education and research output.",
                 source_type="basic_info"
             ),
-            Notice(
+            dict(
                 title="KIIT Admissions",
                 content="KIIT conducts its own entrance examination called KIITEE (KIIT Entrance Examination) for admission to various undergraduate and postgraduate programs. The university also accepts national level examination scores like JEE Main, NEET, CAT, and others depending on the program.",
                 source_type="admissions"
             ),
-            Notice(
+            dict(
                 title="KIIT Facilities",
                 content="KIIT provides world-class facilities including: 24/7 library access, advanced laboratories, sports facilities (cricket, football, basketball, tennis), swimming pool, gym, hospital with 24/7 medical facilities, wi-fi enabled campus, modern hostels with all amenities, food courts and canteens.",
                 source_type="facilities"
@@ -46,7 +46,7 @@ def seed_basic_data():
         
         # KIIT Courses
         courses = [
-            Course(
+            dict(
                 name="Bachelor of Technology (B.Tech)",
                 code="BTECH",
                 description="4-year undergraduate program in engineering and technology",
@@ -54,7 +54,7 @@ def seed_basic_data():
                 duration="4 years",
                 eligibility="10+2 with Physics, Chemistry, and Mathematics. Minimum 60% marks."
             ),
-            Course(
+            dict(
                 name="Computer Science and Engineering",
                 code="CSE",
                 description="Comprehensive program covering software development, algorithms, data structures, AI, machine learning, and emerging technologies",
@@ -62,7 +62,7 @@ def seed_basic_data():
                 duration="4 years",
                 eligibility="B.Tech program with specialization in Computer Science"
             ),
-            Course(
+            dict(
                 name="Electronics and Communication Engineering",
                 code="ECE",
                 description="Program focusing on electronics, telecommunications, signal processing, and embedded systems",
@@ -70,7 +70,7 @@ def seed_basic_data():
                 duration="4 years",
                 eligibility="B.Tech program with specialization in Electronics"
             ),
-            Course(
+            dict(
                 name="Mechanical Engineering",
                 code="ME",
                 description="Traditional engineering discipline covering thermodynamics, mechanics, manufacturing, and design",
@@ -78,7 +78,7 @@ def seed_basic_data():
                 duration="4 years",
                 eligibility="B.Tech program with specialization in Mechanical Engineering"
             ),
-            Course(
+            dict(
                 name="Master of Business Administration (MBA)",
                 code="MBA",
                 description="2-year postgraduate program in management and business administration",
@@ -86,7 +86,7 @@ def seed_basic_data():
                 duration="2 years",
                 eligibility="Bachelor's degree in any discipline with minimum 50% marks. CAT/MAT/XAT scores"
             ),
-            Course(
+            dict(
                 name="Bachelor of Computer Applications (BCA)",
                 code="BCA",
                 description="3-year undergraduate program in computer applications and software development",
@@ -94,7 +94,7 @@ def seed_basic_data():
                 duration="3 years",
                 eligibility="10+2 with Mathematics. Minimum 50% marks."
             ),
-            Course(
+            dict(
                 name="Master of Technology (M.Tech)",
                 code="MTECH",
                 description="2-year postgraduate program in various engineering specializations",
@@ -102,7 +102,7 @@ def seed_basic_data():
                 duration="2 years",
                 eligibility="B.Tech/BE in relevant discipline with minimum 60% marks. GATE score preferred."
             ),
-            Course(
+            dict(
                 name="Bachelor of Science (B.Sc)",
                 code="BSC",
                 description="3-year undergraduate program in various science disciplines",
@@ -112,8 +112,8 @@ def seed_basic_data():
             ),
         ]
         
-        db.add_all(notices)
-        db.add_all(courses)
+        db.bulk_insert_mappings(Notice, notices)
+        db.bulk_insert_mappings(Course, courses)
         db.commit()
         
         print(f"✅ Seeded {len(notices)} notices and {len(courses)} courses")
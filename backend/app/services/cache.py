@@ -1,49 +1,61 @@
 """
 Simple in-memory cache using cachetools
 """
-from cachetools import TTLCache
+from cachetools import TLRUCache
 from app.config import settings
+import threading
 import time
 
 
 class SimpleCache:
     def __init__(self):
-        self.cache = TTLCache(maxsize=1000, ttl=settings.CACHE_TTL)
+        # Entries are (value, ttl) so set() can override CACHE_TTL per key
+        self.cache = TLRUCache(maxsize=1000, ttu=lambda key, entry, now: now + entry[1])
+        # cachetools caches are not thread-safe; sync handlers share it from the threadpool
+        self.lock = threading.Lock()
         self.rate_limits = {}
     
     def get(self, key: str):
         """Get value from cache"""
-        return self.cache.get(key)
+        with self.lock:
+            entry = self.cache.get(key)
+        return entry[0] if entry is not None else None
     
     def set(self, key: str, value, ttl: int = None):
         """Set value in cache"""
-        self.cache[key] = value
+        with self.lock:
+            self.cache[key] = (value, ttl or settings.CACHE_TTL)
     
     def delete(self, key: str):
         """Delete value from cache"""
-        if key in self.cache:
-            del self.cache[key]
+        with self.lock:
+            self.cache.pop(key, None)
     
     def check_rate_limit(self, client_ip: str, limit: int = 100, window: int = 60):
-        """Check rate limit for client IP"""
+        """Check rate limit for client IP (approximate sliding window)"""
         now = time.time()
+        current_window = int(now // window)
         
-        if client_ip not in self.rate_limits:
-            self.rate_limits[client_ip] = []
+        # State is [window index, count in that window, count in the one before]
+        state = self.rate_limits.get(client_ip)
+        if state is None:
+            state = self.rate_limits[client_ip] = [current_window, 0, 0]
+        elif state[0] != current_window:
+            state[2] = state[1] if state[0] == current_window - 1 else 0
+            state[1] = 0
+            state[0] = current_window
         
-        # Remove old requests outside the window
-        self.rate_limits[client_ip] = [
-            req_time for req_time in self.rate_limits[client_ip]
-            if now - req_time < window
-        ]
+        # Weight the previous window by how much of it the sliding window still covers
+        overlap = 1 - (now % window) / window
+        estimate = state[2] * overlap + state[1]
         
         # Check if limit exceeded
-        if len(self.rate_limits[client_ip]) >= limit:
-            return False, len(self.rate_limits[client_ip])
+        if estimate >= limit:
+            return False, int(estimate)
         
         # Add current request
-        self.rate_limits[client_ip].append(now)
-        return True, len(self.rate_limits[client_ip])
+        state[1] += 1
+        return True, int(estimate) + 1
 
 
 # Global instance
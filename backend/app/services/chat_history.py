@@ -0,0 +1,79 @@
+"""
+Buffered chat history writer that batches inserts into PostgreSQL
+"""
+import logging
+import threading
+from datetime import datetime
+
+from sqlalchemy import insert
+
+from app.database import SessionLocal, ChatHistory
+
+logger = logging.getLogger(__name__)
+
+
+class ChatHistoryBuffer:
+    def __init__(self, max_batch: int = 32, flush_interval: float = 0.1):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.pending = []
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+
+    def start(self):
+        """Start the background flush thread"""
+        if self.thread is not None:
+            return
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self._run, name="chat-history-writer", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop the flush thread and write out anything still buffered"""
+        self.stopped.set()
+        self.wakeup.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush()
+
+    def add(self, session_id: str, role: str, content: str):
+        """Queue a chat message for the next batched insert"""
+        with self.lock:
+            self.pending.append({
+                "session_id": session_id,
+                "role": role,
+                "content": content,
+                "timestamp": datetime.utcnow()
+            })
+            if len(self.pending) >= self.max_batch:
+                self.wakeup.set()
+
+    def flush(self):
+        """Insert all buffered messages in a single statement"""
+        with self.lock:
+            rows, self.pending = self.pending, []
+        if not rows:
+            return
+
+        db = SessionLocal()
+        try:
+            db.execute(insert(ChatHistory), rows)
+            db.commit()
+        except Exception as e:
+            logger.error(f"Error saving chat history: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def _run(self):
+        while not self.stopped.is_set():
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            self.flush()
+
+
+# Global instance
+chat_history_buffer = ChatHistoryBuffer()
@@ -2,19 +2,21 @@
 Simplified LLM service using OpenAI via Replit AI Integrations
 """
 import os
-from openai import OpenAI
+from openai import AsyncOpenAI
 from app.config import settings
 
+LLM_ERROR_RESPONSE = "I'm sorry, I encountered an error processing your request."
+
 
 class LLMService:
     def __init__(self):
-        self.client = OpenAI(
+        self.client = AsyncOpenAI(
             api_key=settings.OPENAI_API_KEY,
             base_url=settings.OPENAI_BASE_URL
         )
         self.model = settings.OPENAI_MODEL
 
-    def generate_response(self, query: str, context: str = "") -> str:
+    async def generate_response(self, query: str, context: str = "") -> str:
         """Generate a response using OpenAI"""
         try:
             messages = []
@@ -35,7 +37,7 @@ class LLMService:
                 "content": query
             })
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=settings.LLM_TEMPERATURE,
@@ -46,12 +48,12 @@ class LLMService:
             
         except Exception as e:
             print(f"Error generating response: {e}")
-            return "I'm sorry, I encountered an error processing your request."
+            return LLM_ERROR_RESPONSE
 
-    def generate_embedding(self, text: str) -> list:
+    async def generate_embedding(self, text: str) -> list:
         """Generate embeddings using OpenAI"""
         try:
-            response = self.client.embeddings.create(
+            response = await self.client.embeddings.create(
                 model=settings.OPENAI_EMBEDDING_MODEL,
                 input=text
             )
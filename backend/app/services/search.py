@@ -25,7 +25,10 @@ class SearchService:
                     Notice.source_type.ilike(f"%{keyword}%")
                 ])
             
-            results = db.query(Notice).filter(or_(*conditions)).limit(limit).all()
+            results = db.query(
+                Notice.id, Notice.title, Notice.content, Notice.url,
+                Notice.source_type, Notice.date
+            ).filter(or_(*conditions)).limit(limit).all()
             
             return [{
                 "id": r.id,
@@ -33,7 +36,7 @@ class SearchService:
                 "content": r.content,
                 "url": r.url,
                 "source_type": r.source_type,
-                "date": r.date.isoformat() if r.date else None
+                "date": r.date
             } for r in results]
         finally:
             db.close()
@@ -55,7 +58,10 @@ class SearchService:
                     Course.department.ilike(f"%{keyword}%")
                 ])
             
-            results = db.query(Course).filter(or_(*conditions)).limit(limit).all()
+            results = db.query(
+                Course.id, Course.name, Course.code, Course.description,
+                Course.department, Course.duration
+            ).filter(or_(*conditions)).limit(limit).all()
             
             return [{
                 "id": r.id,